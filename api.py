@@ -32,18 +32,72 @@ Usage:
 """
 
 from health_checker import HealthChecker
+import atexit
+import functools
 import json
 import logging
+import logging.handlers
 import os
+import queue
+import sys
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from urllib.parse import urlparse
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# URL schemes the health checker can request
+_URL_SCHEMES = ('http', 'https')
+
+@functools.lru_cache(maxsize=4096)
+def _is_valid_url(url: str) -> bool:
+    """Check that a URL string is an http(s) URL with a host; cached since URL lists are re-checked"""
+    # Leading whitespace is ignored, as requests strips it before sending
+    scheme, separator, rest = url.lstrip().partition('://')
+    host_start = rest[:1]
+    return (bool(separator) and scheme.lower() in _URL_SCHEMES
+            and host_start != '' and host_start not in '/?#' and not host_start.isspace())
+
+def _to_json(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    # orjson writes non-ASCII characters as-is; match it
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for records logged within the same second"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (whole second, formatted time) of the last record
+        self._cached_time = (None, None)
+    
+    def formatTime(self, record, datefmt=None):
+        # Without datefmt the default format includes milliseconds, so it can't be reused
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, cached_text = self._cached_time
+        if second != cached_second:
+            cached_text = super().formatTime(record, datefmt)
+            self._cached_time = (second, cached_text)
+        return cached_text
+
+# The HealthCheckerAPI instance whose logging handlers are attached to the shared logger
+_logger_owner = None
 
 class HealthCheckerAPI:
     """
     API wrapper for website health checking functionality with logging
     """
     
+    # Number of log records buffered before they are written to the log file
+    LOG_BUFFER_CAPACITY = 1024
+    
     def __init__(self, log_file: Optional[str] = None, enable_console_logging: bool = True):
         """
         Initialize the health checker API with logging
@@ -58,7 +112,7 @@ class HealthCheckerAPI:
         # Log initialization
         self.logger.info("=" * 60)
         self.logger.info("Health Checker API initialized")
-        self.logger.info(f"Timestamp: {datetime.now().isoformat()}")
+        self.logger.info("Timestamp: %s", datetime.now().isoformat())
         self.logger.info("=" * 60)
     
     def setup_logging(self, log_file: Optional[str] = None, enable_console_logging: bool = True):
@@ -69,6 +123,15 @@ class HealthCheckerAPI:
             log_file (str): Path to log file
             enable_console_logging (bool): Whether to also log to console
         """
+        global _logger_owner
+        
+        # Every instance shares one logger; flush and stop the listener of whichever
+        # instance currently owns it (or of a previous call on this instance)
+        # before replacing its handlers, so records stay in order
+        self.close()
+        if _logger_owner is not None:
+            _logger_owner.close()
+        
         # Create logger
         self.logger = logging.getLogger('HealthCheckerAPI')
         self.logger.setLevel(logging.INFO)
@@ -77,7 +140,7 @@ class HealthCheckerAPI:
         self.logger.handlers.clear()
         
         # Create formatter
-        formatter = logging.Formatter(
+        formatter = _CachedTimeFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
@@ -91,16 +154,60 @@ class HealthCheckerAPI:
         file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        
+        # Buffer file records and write them in batches; errors are written immediately
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=self.LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        buffered_handler.setLevel(logging.INFO)
+        self._log_handlers = [buffered_handler]
+        # MemoryHandler.close() flushes to its target but leaves it open
+        self._file_handler = file_handler
         
         # Set up console handler if enabled
         if enable_console_logging:
             console_handler = logging.StreamHandler()
             console_handler.setLevel(logging.INFO)
             console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
+            self._log_handlers.append(console_handler)
         
-        self.logger.info(f"Logging initialized - Log file: {log_file}")
+        # Callers only enqueue records; a background listener thread does the handler I/O
+        log_queue = queue.Queue(-1)
+        self._queue_handler = logging.handlers.QueueHandler(log_queue)
+        self.logger.addHandler(self._queue_handler)
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, *self._log_handlers, respect_handler_level=True
+        )
+        self._log_listener.start()
+        _logger_owner = self
+        atexit.register(self.close)
+        
+        self.logger.info("Logging initialized - Log file: %s", log_file)
+    
+    def close(self):
+        """
+        Stop the background logging thread and flush pending log records
+        
+        Safe to call more than once. Called automatically at interpreter exit, and
+        when another instance sets up logging.
+        """
+        global _logger_owner
+        
+        listener = getattr(self, '_log_listener', None)
+        if listener is None:
+            return
+        
+        self._log_listener = None
+        if _logger_owner is self:
+            _logger_owner = None
+        atexit.unregister(self.close)
+        self.logger.removeHandler(self._queue_handler)
+        listener.stop()
+        for handler in self._log_handlers:
+            handler.close()
+        self._file_handler.close()
     
     def log_result(self, result: Dict[str, Any], operation: str = "health_check"):
         """
@@ -110,25 +217,34 @@ class HealthCheckerAPI:
             result (dict): Health check result
             operation (str): Operation type for logging context
         """
-        self.logger.info(f"--- {operation.upper()} RESULT ---")
-        self.logger.info(f"URL: {result['url']}")
-        self.logger.info(f"Status Code: {result.get('status_code', 'N/A')}")
-        self.logger.info(f"Healthy: {result['status_healthy']}")
-        self.logger.info(f"Response Time: {result.get('response_time', 'N/A')}s")
-        self.logger.info(f"Final URL: {result.get('final_url', 'N/A')}")
+        # One multi-line record per result; results with an error are logged at ERROR
+        level = logging.ERROR if result.get('error') else logging.INFO
+        if not self.logger.isEnabledFor(level):
+            return
+        
+        lines = [
+            f"--- {operation.upper()} RESULT ---",
+            f"URL: {result['url']}",
+            f"Status Code: {result.get('status_code', 'N/A')}",
+            f"Healthy: {result['status_healthy']}",
+            f"Response Time: {result.get('response_time', 'N/A')}s",
+            f"Final URL: {result.get('final_url', 'N/A')}",
+        ]
         
         if result.get('ssl_checked'):
-            self.logger.info(f"SSL Valid: {result['ssl_valid']}")
+            lines.append(f"SSL Valid: {result['ssl_valid']}")
             if result.get('ssl_expiry'):
-                self.logger.info(f"SSL Expires: {result['ssl_expiry']}")
-                self.logger.info(f"Days Until Expiry: {result.get('ssl_days_until_expiry', 'N/A')}")
+                lines.append(f"SSL Expires: {result['ssl_expiry']}")
+                lines.append(f"Days Until Expiry: {result.get('ssl_days_until_expiry', 'N/A')}")
         
         if result.get('error'):
-            self.logger.error(f"Error: {result['error']}")
+            lines.append(f"Error: {result['error']}")
         
-        self.logger.info("-" * 40)
+        lines.append("-" * 40)
+        self.logger.log(level, "%s", "\n".join(lines))
     
-    def check_website(self, url: str, timeout: int = 10, follow_redirects: bool = True) -> Dict[str, Any]:
+    def check_website(self, url: str, timeout: int = 10, follow_redirects: bool = True,
+                      method: str = 'HEAD', *, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Check the health of a single website
         
@@ -136,24 +252,46 @@ class HealthCheckerAPI:
             url (str): Website URL to check
             timeout (int): Request timeout in seconds (default: 10)
             follow_redirects (bool): Whether to follow redirects (default: True)
+            method (str): 'HEAD' (falls back to GET if rejected) or 'GET' (default: 'HEAD')
+            force_refresh (bool): Check even if a recent result is cached (default: False)
             
         Returns:
             dict: Health check results containing:
                 - url: Original URL
-                - timestamp: Check timestamp
+                - timestamp: Check time as a Unix timestamp (seconds since the epoch)
                 - status_code: HTTP status code
                 - status_healthy: Boolean indicating if site is healthy
                 - response_time: Response time in seconds
-                - final_url: Final URL after redirects
+                - final_url: Final URL after redirects (the original URL if not redirected)
+                - redirected: Whether the request was redirected
                 - ssl_checked: Whether SSL was checked
                 - ssl_valid: SSL certificate validity
                 - ssl_expiry: SSL certificate expiry date
                 - ssl_days_until_expiry: Days until SSL expires
                 - error: Error message if any
         """
-        self.logger.info(f"Starting health check for URL: {url}")
-        self.logger.info(f"Config - Timeout: {timeout}s, Follow Redirects: {follow_redirects}")
+        self.logger.info("Starting health check for URL: %s", url)
+        self.logger.info("Config - Timeout: %ss, Follow Redirects: %s, Method: %s", timeout, follow_redirects, method)
+        return self._check_and_log(url, timeout, follow_redirects, method, force_refresh)
+    
+    def _check_and_log(self, url: str, timeout: int, follow_redirects: bool, method: str,
+                       force_refresh: bool) -> Dict[str, Any]:
+        """
+        Validate and check a single website, then log its result
         
+        Shared by the single and bulk entry points, which each log their own
+        request configuration once.
+        
+        Args:
+            url (str): Website URL to check
+            timeout (int): Request timeout in seconds
+            follow_redirects (bool): Whether to follow redirects
+            method (str): HTTP method ('HEAD' or 'GET')
+            force_refresh (bool): Check even if a recent result is cached
+            
+        Returns:
+            dict: Health check results
+        """
         if not self._validate_url(url):
             error_result = {
                 'url': url,
@@ -163,20 +301,24 @@ class HealthCheckerAPI:
                 'status_code': None,
                 'response_time': None,
                 'final_url': url,
+                'redirected': False,
                 'ssl_checked': False,
                 'ssl_valid': False,
                 'ssl_expiry': None,
                 'ssl_days_until_expiry': None
             }
-            self.logger.error(f"Invalid URL format: {url}")
+            self.logger.error("Invalid URL format: %s", url)
             self.log_result(error_result, "validation_error")
             return error_result
         
-        result = self.health_checker.check_website_health(url, timeout, follow_redirects)
+        result = self.health_checker.check_website_health(url, timeout, follow_redirects, method,
+                                                          force_refresh=force_refresh)
         self.log_result(result, "single_check")
         return result
     
-    def check_multiple_websites(self, urls: List[str], timeout: int = 10, follow_redirects: bool = True) -> List[Dict[str, Any]]:
+    def check_multiple_websites(self, urls: List[str], timeout: int = 10, follow_redirects: bool = True,
+                                method: str = 'HEAD', *, force_refresh: bool = False,
+                                batch_timeout: Optional[float] = None) -> List[Dict[str, Any]]:
         """
         Check the health of multiple websites
         
@@ -184,28 +326,119 @@ class HealthCheckerAPI:
             urls (list): List of website URLs to check
             timeout (int): Request timeout in seconds (default: 10)
             follow_redirects (bool): Whether to follow redirects (default: True)
+            method (str): 'HEAD' (falls back to GET if rejected) or 'GET' (default: 'HEAD')
+            force_refresh (bool): Check even if a recent result is cached (default: False)
+            batch_timeout (float): Seconds to wait for the whole batch; checks still running after this
+                are reported with a batch timeout error (default: None, wait for every check)
+            
+        Returns:
+            list: List of health check results for each URL, in input order
+        """
+        results = [None] * len(urls)
+        for index, result in self._iter_checks(urls, timeout, follow_redirects, method, force_refresh, batch_timeout):
+            results[index] = result
+        return results
+    
+    def iter_check_multiple_websites(self, urls: List[str], timeout: int = 10,
+                                     follow_redirects: bool = True, method: str = 'HEAD', *,
+                                     force_refresh: bool = False,
+                                     batch_timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Check the health of multiple websites, yielding each result as soon as it is ready
+        
+        Results are yielded in completion order, not input order; use the 'url'
+        field to match them up.
+        
+        Args:
+            urls (list): List of website URLs to check
+            timeout (int): Request timeout in seconds (default: 10)
+            follow_redirects (bool): Whether to follow redirects (default: True)
+            method (str): 'HEAD' (falls back to GET if rejected) or 'GET' (default: 'HEAD')
+            force_refresh (bool): Check even if a recent result is cached (default: False)
+            batch_timeout (float): Seconds to wait for the whole batch; checks still running after this
+                are reported with a batch timeout error (default: None, wait for every check)
+            
+        Yields:
+            dict: Health check result for one URL
+        """
+        for _, result in self._iter_checks(urls, timeout, follow_redirects, method, force_refresh, batch_timeout):
+            yield result
+    
+    def _iter_checks(self, urls: List[str], timeout: int, follow_redirects: bool,
+                     method: str, force_refresh: bool,
+                     batch_timeout: Optional[float]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Run the checks for multiple websites concurrently
+        
+        Args:
+            urls (list): List of website URLs to check
+            timeout (int): Request timeout in seconds
+            follow_redirects (bool): Whether to follow redirects
+            method (str): HTTP method ('HEAD' or 'GET')
+            force_refresh (bool): Check even if a recent result is cached
+            batch_timeout (float): Seconds to wait for the whole batch, or None
+            
+        Yields:
+            tuple: (index of the URL in urls, health check result) in completion order
+        """
+        self.logger.info("Starting bulk health check for %d URLs", len(urls))
+        self.logger.info("Config - Timeout: %ss, Follow Redirects: %s, Method: %s", timeout, follow_redirects, method)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("URLs to check: %s", ', '.join(urls))
+        
+        def check(i, url):
+            self.logger.info("Checking URL %d/%d: %s", i + 1, len(urls), url)
+            return self._check_and_log(url, timeout, follow_redirects, method, force_refresh)
+        
+        # Checks are network-bound, so run them concurrently
+        yield from self.health_checker.run_checks(
+            urls, check, batch_timeout=batch_timeout,
+            on_timeout=lambda _, result: self.log_result(result, "batch_timeout")
+        )
+        
+        self.logger.info("Bulk health check completed for %d URLs", len(urls))
+    
+    async def acheck_multiple_websites(self, urls: List[str], timeout: int = 10, follow_redirects: bool = True,
+                                       method: str = 'HEAD', *, force_refresh: bool = False,
+                                       max_concurrency: int = 100) -> List[Dict[str, Any]]:
+        """
+        Asynchronously check the health of multiple websites
+        
+        Checks run on worker threads via HealthChecker.run_checks_async, so the
+        event loop stays free, including when the coroutine is cancelled.
+        
+        Args:
+            urls (list): List of website URLs to check
+            timeout (int): Request timeout in seconds (default: 10)
+            follow_redirects (bool): Whether to follow redirects (default: True)
+            method (str): 'HEAD' (falls back to GET if rejected) or 'GET' (default: 'HEAD')
+            force_refresh (bool): Check even if a recent result is cached (default: False)
+            max_concurrency (int): Maximum number of checks in flight (default: 100)
             
         Returns:
-            list: List of health check results for each URL
+            list: List of health check results for each URL, in input order
         """
-        self.logger.info(f"Starting bulk health check for {len(urls)} URLs")
-        self.logger.info(f"URLs to check: {', '.join(urls)}")
+        self.logger.info("Starting async bulk health check for %d URLs", len(urls))
+        self.logger.info("Config - Timeout: %ss, Follow Redirects: %s, Method: %s", timeout, follow_redirects, method)
+        if not urls:
+            return []
         
-        results = []
-        for i, url in enumerate(urls, 1):
-            self.logger.info(f"Checking URL {i}/{len(urls)}: {url}")
-            result = self.check_website(url, timeout, follow_redirects)
-            results.append(result)
+        results = await self.health_checker.run_checks_async(
+            urls,
+            lambda _, url: self._check_and_log(url, timeout, follow_redirects, method, force_refresh),
+            max_concurrency=max_concurrency
+        )
         
-        self.logger.info(f"Bulk health check completed for {len(urls)} URLs")
+        self.logger.info("Async bulk health check completed for %d URLs", len(urls))
         return results
     
-    def get_summary(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def get_summary(self, results: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Generate summary statistics from health check results
         
         Args:
-            results (list): List of health check results
+            results (iterable): Health check results, e.g. a list or the iterator from
+                iter_check_multiple_websites (consumed without being stored)
             
         Returns:
             dict: Summary statistics including:
@@ -225,25 +458,27 @@ class HealthCheckerAPI:
         summary = self.health_checker.get_health_summary(results)
         
         # Log summary details
-        self.logger.info("--- SUMMARY STATISTICS ---")
-        self.logger.info(f"Total Sites: {summary.get('total_sites', 0)}")
-        self.logger.info(f"Healthy Sites: {summary.get('healthy_sites', 0)}")
-        self.logger.info(f"Unhealthy Sites: {summary.get('unhealthy_sites', 0)}")
-        self.logger.info(f"Health Percentage: {summary.get('health_percentage', 0):.1f}%")
-        self.logger.info(f"Average Response Time: {summary.get('average_response_time', 0):.3f}s")
-        self.logger.info(f"SSL Sites Checked: {summary.get('ssl_sites_checked', 0)}")
-        self.logger.info(f"Valid SSL Sites: {summary.get('ssl_valid_sites', 0)}")
-        self.logger.info(f"Sites with Errors: {summary.get('sites_with_errors', 0)}")
-        
-        if summary.get('fastest_response_time'):
-            self.logger.info(f"Fastest Response: {summary['fastest_response_time']:.3f}s")
-        if summary.get('slowest_response_time'):
-            self.logger.info(f"Slowest Response: {summary['slowest_response_time']:.3f}s")
-        
-        self.logger.info("-" * 30)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("--- SUMMARY STATISTICS ---")
+            self.logger.info("Total Sites: %s", summary.get('total_sites', 0))
+            self.logger.info("Healthy Sites: %s", summary.get('healthy_sites', 0))
+            self.logger.info("Unhealthy Sites: %s", summary.get('unhealthy_sites', 0))
+            self.logger.info("Health Percentage: %.1f%%", summary.get('health_percentage', 0))
+            self.logger.info("Average Response Time: %.3fs", summary.get('average_response_time', 0))
+            self.logger.info("SSL Sites Checked: %s", summary.get('ssl_sites_checked', 0))
+            self.logger.info("Valid SSL Sites: %s", summary.get('ssl_valid_sites', 0))
+            self.logger.info("Sites with Errors: %s", summary.get('sites_with_errors', 0))
+            
+            if summary.get('fastest_response_time'):
+                self.logger.info("Fastest Response: %.3fs", summary['fastest_response_time'])
+            if summary.get('slowest_response_time'):
+                self.logger.info("Slowest Response: %.3fs", summary['slowest_response_time'])
+            
+            self.logger.info("-" * 30)
         return summary
     
-    def check_website_json(self, url: str, timeout: int = 10, follow_redirects: bool = True) -> str:
+    def check_website_json(self, url: str, timeout: int = 10, follow_redirects: bool = True,
+                           method: str = 'HEAD', *, force_refresh: bool = False) -> str:
         """
         Check website health and return results as JSON string
         
@@ -251,14 +486,18 @@ class HealthCheckerAPI:
             url (str): Website URL to check
             timeout (int): Request timeout in seconds (default: 10)
             follow_redirects (bool): Whether to follow redirects (default: True)
+            method (str): 'HEAD' (falls back to GET if rejected) or 'GET' (default: 'HEAD')
+            force_refresh (bool): Check even if a recent result is cached (default: False)
             
         Returns:
             str: JSON formatted health check results
         """
-        result = self.check_website(url, timeout, follow_redirects)
-        return json.dumps(result, indent=2)
+        result = self.check_website(url, timeout, follow_redirects, method, force_refresh=force_refresh)
+        return _to_json(result)
     
-    def check_multiple_websites_json(self, urls: List[str], timeout: int = 10, follow_redirects: bool = True) -> str:
+    def check_multiple_websites_json(self, urls: List[str], timeout: int = 10, follow_redirects: bool = True,
+                                     method: str = 'HEAD', *, force_refresh: bool = False,
+                                     batch_timeout: Optional[float] = None) -> str:
         """
         Check multiple websites and return results as JSON string
         
@@ -266,12 +505,17 @@ class HealthCheckerAPI:
             urls (list): List of website URLs to check
             timeout (int): Request timeout in seconds (default: 10)
             follow_redirects (bool): Whether to follow redirects (default: True)
+            method (str): 'HEAD' (falls back to GET if rejected) or 'GET' (default: 'HEAD')
+            force_refresh (bool): Check even if a recent result is cached (default: False)
+            batch_timeout (float): Seconds to wait for the whole batch; checks still running after this
+                are reported with a batch timeout error (default: None, wait for every check)
             
         Returns:
             str: JSON formatted health check results
         """
-        results = self.check_multiple_websites(urls, timeout, follow_redirects)
-        return json.dumps(results, indent=2)
+        results = self.check_multiple_websites(urls, timeout, follow_redirects, method,
+                                               force_refresh=force_refresh, batch_timeout=batch_timeout)
+        return _to_json(results)
     
     def _validate_url(self, url: str) -> bool:
         """
@@ -281,24 +525,25 @@ class HealthCheckerAPI:
             url (str): URL to validate
             
         Returns:
-            bool: True if URL is valid, False otherwise
+            bool: True if URL is an http(s) URL with a host, False otherwise
         """
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except:
+        if not isinstance(url, str):
             return False
+        return _is_valid_url(url)
 
 # Command line interface
 def main():
     """Command line interface for the health checker API"""
-    import sys
     import argparse
     
     parser = argparse.ArgumentParser(description='Website Health Checker API')
     parser.add_argument('urls', nargs='+', help='Website URLs to check')
     parser.add_argument('--timeout', type=int, default=10, help='Request timeout in seconds (default: 10)')
     parser.add_argument('--no-redirects', action='store_true', help='Do not follow redirects')
+    parser.add_argument('--method', choices=['HEAD', 'GET'], default='HEAD',
+                        help='HTTP method to check with; HEAD falls back to GET if rejected (default: HEAD)')
+    parser.add_argument('--batch-timeout', type=float,
+                        help='Seconds to wait for all checks of multiple URLs; unfinished checks are reported as timed out')
     parser.add_argument('--summary', action='store_true', help='Show summary statistics')
     parser.add_argument('--json', action='store_true', help='Output results as JSON')
     parser.add_argument('--log-file', type=str, help='Custom log file path (default: health_checker_YYYYMMDD.log)')
@@ -314,15 +559,16 @@ def main():
     
     # Check websites
     if len(args.urls) == 1:
-        result = api.check_website(args.urls[0], args.timeout, not args.no_redirects)
+        result = api.check_website(args.urls[0], args.timeout, not args.no_redirects, args.method)
         if args.json:
-            print(json.dumps(result, indent=2))
+            print(_to_json(result))
         else:
             print_single_result(result)
     else:
-        results = api.check_multiple_websites(args.urls, args.timeout, not args.no_redirects)
+        results = api.check_multiple_websites(args.urls, args.timeout, not args.no_redirects, args.method,
+                                              batch_timeout=args.batch_timeout)
         if args.json:
-            print(json.dumps(results, indent=2))
+            print(_to_json(results))
         else:
             print_multiple_results(results)
             
@@ -333,13 +579,22 @@ def main():
             print("="*50)
             print_summary(summary)
 
+        if any((result['error'] or '').startswith('Batch Timeout') for result in results):
+            # Abandoned checks still hold executor threads that the interpreter
+            # would join on exit, so flush everything and leave without them
+            api.close()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(0)
+
 def print_single_result(result: Dict[str, Any]):
     """Print formatted single result"""
     print(f"\nHealth Check Results for: {result['url']}")
     print("-" * 50)
     print(f"Status Code: {result['status_code'] or 'N/A'}")
     print(f"Healthy: {'✓' if result['status_healthy'] else '✗'}")
-    print(f"Response Time: {result['response_time']:.3f}s" if result['response_time'] else "N/A")
+    response_time = result.get('response_time')
+    print(f"Response Time: {response_time:.3f}s" if response_time is not None else "Response Time: N/A")
     print(f"Final URL: {result['final_url']}")
     
     if result['ssl_checked']:
@@ -354,25 +609,28 @@ def print_single_result(result: Dict[str, Any]):
 
 def print_multiple_results(results: List[Dict[str, Any]]):
     """Print formatted multiple results"""
-    print(f"\nHealth Check Results for {len(results)} websites:")
-    print("=" * 80)
+    # Build the whole report first and write it to stdout in one call
+    lines = [f"\nHealth Check Results for {len(results)} websites:", "=" * 80]
     
     for i, result in enumerate(results, 1):
-        print(f"\n{i}. {result['url']}")
-        print(f"   Status: {result['status_code'] or 'FAILED'} | "
-              f"Healthy: {'✓' if result['status_healthy'] else '✗'} | "
-              f"Time: {result['response_time']:.3f}s" if result['response_time'] else "Time: N/A")
+        response_time = result.get('response_time')
+        time_text = f"{response_time:.3f}s" if response_time is not None else "N/A"
+        lines.append(f"\n{i}. {result['url']}")
+        lines.append(f"   Status: {result['status_code'] or 'FAILED'} | "
+                     f"Healthy: {'✓' if result['status_healthy'] else '✗'} | "
+                     f"Time: {time_text}")
         
         if result['ssl_checked']:
             ssl_status = '✓' if result['ssl_valid'] else '✗'
-            print(f"   SSL: {ssl_status}", end="")
-            if result['ssl_days_until_expiry'] is not None:
-                print(f" (expires in {result['ssl_days_until_expiry']} days)")
-            else:
-                print()
+            days = result['ssl_days_until_expiry']
+            expiry = f" (expires in {days} days)" if days is not None else ""
+            lines.append(f"   SSL: {ssl_status}{expiry}")
         
         if result['error']:
-            print(f"   Error: {result['error']}")
+            lines.append(f"   Error: {result['error']}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 def print_summary(summary: Dict[str, Any]):
     """Print formatted summary statistics"""
@@ -1,73 +1,439 @@
 import requests
+from requests.adapters import HTTPAdapter
+from requests.sessions import merge_setting
+from urllib3.util.connection import allowed_gai_family
+from urllib3.util.ssl_ import create_urllib3_context
+import asyncio
 import ssl
 import socket
+import selectors
+import errno
+import hashlib
+import http.cookiejar
+import os
 from datetime import datetime, timezone
 from urllib.parse import urlparse
+import threading
 import time
+import concurrent.futures
+import functools
+
+try:
+    from cryptography import x509
+except ImportError:
+    x509 = None
+
+# Seconds a resolved address list is reused, and the maximum number of cached lookups
+DNS_CACHE_TTL = 300
+DNS_CACHE_MAXSIZE = 1024
+
+# (getaddrinfo arguments) -> (expiry on the monotonic clock, address tuple)
+_dns_cache = {}
+_dns_cache_lock = threading.Lock()
+# The uncached resolver; kept if this module is reloaded after installing the cache
+_socket_getaddrinfo = getattr(socket.getaddrinfo, 'uncached', socket.getaddrinfo)
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """
+    socket.getaddrinfo with a process-wide TTL cache
+    
+    Failed lookups are not cached.
+    
+    Args:
+        host, port, family, type, proto, flags: As for socket.getaddrinfo
+        
+    Returns:
+        list: Address info tuples, as returned by socket.getaddrinfo
+    """
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    with _dns_cache_lock:
+        entry = _dns_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return list(entry[1])
+    
+    addresses = tuple(_socket_getaddrinfo(host, port, family, type, proto, flags))
+    
+    with _dns_cache_lock:
+        if key not in _dns_cache and len(_dns_cache) >= DNS_CACHE_MAXSIZE:
+            # Evict the oldest entry
+            del _dns_cache[next(iter(_dns_cache))]
+        _dns_cache[key] = (now + DNS_CACHE_TTL, addresses)
+    return list(addresses)
+
+_cached_getaddrinfo.uncached = _socket_getaddrinfo
+
+# Install the cache process-wide so urllib3 (and so every requests call) resolves through it
+socket.getaddrinfo = _cached_getaddrinfo
+
+# Seconds a certificate expiry is reused, whether cached by certificate or by host,
+# and the maximum number of cached certificates
+CERT_CACHE_TTL = 300
+CERT_CACHE_MAXSIZE = 1024
+
+# SHA-256 of the DER certificate -> (expiry datetime or None, time cached on the monotonic clock)
+_cert_cache = {}
+_cert_cache_lock = threading.Lock()
+
+# Final URLs repeat across checks of the same sites; parse results are immutable
+_parse_url = functools.lru_cache(maxsize=1024)(urlparse)
+
+@functools.lru_cache(maxsize=1024)
+def _environ_proxies(origin, no_proxy=None):
+    """
+    Get the proxies the environment configures for requests to an origin
+    
+    Finding them scans every environment variable, so the result is cached.
+    
+    Args:
+        origin (str): URL scheme and network location, e.g. 'https://example.com'
+        no_proxy (str): Hosts that bypass the proxy, overriding the environment
+        
+    Returns:
+        tuple: (scheme, proxy URL) pairs
+    """
+    return tuple(requests.utils.get_environ_proxies(origin, no_proxy=no_proxy).items())
+
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+def _parse_cert_time(value):
+    """
+    Parse a certificate time string as returned by ssl.SSLSocket.getpeercert()
+    
+    The format is fixed, e.g. 'Jul 15 12:00:00 2025 GMT' (the day is space-padded),
+    so it is sliced directly; anything else falls back to strptime.
+    
+    Args:
+        value (str): Certificate time string
+        
+    Returns:
+        datetime: Parsed time (timezone-aware, UTC)
+        
+    Raises:
+        ValueError: If the string is not a certificate time
+    """
+    if len(value) == 24 and value.endswith(' GMT'):
+        try:
+            return datetime(
+                int(value[16:20]), _MONTHS[value[0:3]], int(value[4:6]),
+                int(value[7:9]), int(value[10:12]), int(value[13:15]),
+                tzinfo=timezone.utc
+            )
+        except (KeyError, ValueError):
+            pass
+    
+    return datetime.strptime(value, '%b %d %H:%M:%S %Y %Z').replace(tzinfo=timezone.utc)
+
+def _parse_der_expiry(der):
+    """
+    Parse the expiry date of a DER-encoded certificate with cryptography
+    
+    Args:
+        der (bytes): Certificate as returned by ssl.SSLSocket.getpeercert(binary_form=True)
+        
+    Returns:
+        datetime: Certificate expiry (timezone-aware, UTC)
+        
+    Raises:
+        ValueError: If the certificate can't be parsed
+    """
+    cert = x509.load_der_x509_certificate(der)
+    try:
+        return cert.not_valid_after_utc
+    except AttributeError:
+        # cryptography < 42 only has the naive UTC datetime
+        return cert.not_valid_after.replace(tzinfo=timezone.utc)
+
+class CachedEnvironmentSession(requests.Session):
+    """
+    Session that reads proxy settings from the environment once per origin
+    
+    requests.Session scans the whole environment for proxy settings on every
+    request. This session caches the proxies found for each scheme and host, so
+    proxy environment variables changed after the first request to an origin are
+    not picked up.
+    """
+    
+    def merge_environment_settings(self, url, proxies, stream, verify, cert):
+        if not self.trust_env:
+            return super().merge_environment_settings(url, proxies, stream, verify, cert)
+        
+        proxies = dict(proxies or {})
+        parsed = _parse_url(url)
+        for scheme, proxy in _environ_proxies(f'{parsed.scheme}://{parsed.netloc}', proxies.get('no_proxy')):
+            proxies.setdefault(scheme, proxy)
+        if verify is True or verify is None:
+            verify = os.environ.get('REQUESTS_CA_BUNDLE') or os.environ.get('CURL_CA_BUNDLE') or verify
+        
+        return {
+            'proxies': merge_setting(proxies, self.proxies),
+            'stream': merge_setting(stream, self.stream),
+            'verify': merge_setting(verify, self.verify),
+            'cert': merge_setting(cert, self.cert),
+        }
+
+class PeerCertAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that records the TLS peer certificate on each response
+    
+    The certificate is read from the connection the response arrived on, so it can
+    be inspected without a second TLS handshake. It is stored as
+    ``response.peer_cert`` in ssl.SSLSocket.getpeercert() form and as
+    ``response.peer_cert_der`` in DER form, or None for plain HTTP and connections
+    it can't be read from.
+    
+    If an ssl_context is given, every pooled HTTPS connection is created from it
+    instead of from a new per-connection context. If ca_bundle names the CA file or
+    directory already loaded into that context, requests verified against it don't
+    load it into the context again for each new connection.
+    """
+    
+    def __init__(self, *args, ssl_context=None, ca_bundle=None, **kwargs):
+        # Set before HTTPAdapter.__init__, which calls init_poolmanager
+        self.ssl_context = ssl_context
+        self.ca_bundle = ca_bundle
+        super().__init__(*args, **kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        if self.ssl_context is not None:
+            kwargs.setdefault('ssl_context', self.ssl_context)
+        super().init_poolmanager(*args, **kwargs)
+    
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        # Only pools built from the shared context have the bundle loaded already;
+        # proxy pools create their own context and still need ca_certs
+        shared = self.ssl_context is not None and conn.conn_kw.get('ssl_context') is self.ssl_context
+        if shared and self.ca_bundle is not None:
+            if conn.ca_certs == self.ca_bundle:
+                conn.ca_certs = None
+            if conn.ca_cert_dir == self.ca_bundle:
+                conn.ca_cert_dir = None
+    
+    def build_response(self, req, resp):
+        response = super().build_response(req, resp)
+        response.peer_cert = None
+        response.peer_cert_der = None
+        
+        # The connection is still attached here because requests reads the body later
+        sock = getattr(getattr(resp, 'connection', None), 'sock', None)
+        if sock is not None and hasattr(sock, 'getpeercert'):
+            try:
+                response.peer_cert = sock.getpeercert()
+                response.peer_cert_der = sock.getpeercert(binary_form=True)
+            except (ValueError, OSError):
+                pass
+        return response
 
 class HealthChecker:
     """Website health checker class that performs comprehensive health checks"""
     
-    def __init__(self):
-        self.session = requests.Session()
+    # Connection pool sizing for the default session
+    POOL_CONNECTIONS = 50
+    POOL_MAXSIZE = 100
+    
+    # Upper bound on concurrent checks in check_multiple_websites
+    MAX_WORKERS = 32
+    
+    # Threads used to resolve a batch's hosts ahead of its checks
+    DNS_PREFETCH_WORKERS = 16
+    
+    # HEAD responses with these status codes (Method Not Allowed, Not Implemented) are retried with GET
+    HEAD_FALLBACK_STATUS_CODES = (405, 501)
+    
+    # Streamed bodies up to this many bytes are drained rather than dropping the connection
+    KEEPALIVE_DRAIN_LIMIT = 64 * 1024
+    
+    # Seconds a health check result is reused, and how many results are kept
+    RESULT_CACHE_TTL = 30
+    RESULT_CACHE_MAXSIZE = 512
+    
+    def __init__(self, session=None):
+        """
+        Args:
+            session (requests.Session): Session to issue requests with. If None, a
+                session with a pooled keep-alive adapter is created. Mount a
+                PeerCertAdapter on it to avoid a separate SSL certificate probe.
+        """
+        # Loaded once; pooled connections share one context and certificate probes another
+        self._ca_bundle = self._default_ca_bundle()
+        self._ssl_context = self._create_ssl_context(self._ca_bundle)
+        self._probe_ssl_context = self._create_ssl_context(self._ca_bundle, check_hostname=True)
+        self.session = session if session is not None else self._create_session()
         # Set a default user agent to avoid blocking
         self.session.headers.update({
             'User-Agent': 'Website Health Checker 1.0'
         })
+        # (hostname, port) -> (expiry datetime, time cached on the monotonic clock)
+        self._ssl_cache = {}
+        # (url, timeout, follow_redirects, method) -> (result, time cached on the monotonic clock)
+        self._result_cache = {}
+        self._result_cache_lock = threading.Lock()
+    
+    @staticmethod
+    def _default_ca_bundle():
+        """
+        Get the CA bundle requests verifies against when verify=True
+        
+        Returns:
+            str: Path of the CA bundle file or directory
+        """
+        return (os.environ.get('REQUESTS_CA_BUNDLE')
+                or os.environ.get('CURL_CA_BUNDLE')
+                or requests.utils.DEFAULT_CA_BUNDLE_PATH)
+    
+    def _create_ssl_context(self, ca_bundle, check_hostname=None):
+        """
+        Create an SSL context with the CA bundle loaded
+        
+        Args:
+            ca_bundle (str): Path of the CA bundle file or directory
+            check_hostname (bool): If True, the context itself checks the certificate
+                matches the hostname. If None, urllib3's default is kept: urllib3 1.26
+                turns it off and matches hostnames itself, which also covers IP
+                address hosts it connects to without a server name.
+            
+        Returns:
+            ssl.SSLContext: Context that requires a valid certificate
+        """
+        context = create_urllib3_context()
+        context.verify_mode = ssl.CERT_REQUIRED
+        if check_hostname is not None:
+            context.check_hostname = check_hostname
+        if os.path.isdir(ca_bundle):
+            context.load_verify_locations(capath=ca_bundle)
+        else:
+            context.load_verify_locations(cafile=ca_bundle)
+        return context
     
-    def check_website_health(self, url, timeout=10, follow_redirects=True):
+    def _create_session(self):
+        """
+        Create a session whose connections are kept alive and reused across checks
+        
+        All HTTPS connections share one SSL context with the CA bundle already
+        loaded, so each new connection skips building its own and re-reading the
+        bundle. Proxy settings are read from the environment once per origin, and
+        cookies set by checked sites are not kept between checks.
+        
+        Returns:
+            requests.Session: Session with a pooled adapter mounted for http and https
+        """
+        session = CachedEnvironmentSession()
+        # Checks are independent; a jar collecting every site's cookies would only
+        # slow down each request's cookie lookup
+        session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        adapter = PeerCertAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=0,
+            ssl_context=self._ssl_context,
+            ca_bundle=self._ca_bundle
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def check_website_health(self, url, timeout=10, follow_redirects=True, method='HEAD', *, force_refresh=False):
         """
         Perform comprehensive health check on a website
         
+        A successful result checked within the last RESULT_CACHE_TTL seconds with
+        the same URL, timeout, redirect setting and method is returned again with a
+        new timestamp instead of checking the website again. Failed checks are not
+        cached.
+        
         Args:
             url (str): Website URL to check
             timeout (int): Request timeout in seconds
             follow_redirects (bool): Whether to follow redirects
+            method (str): HTTP method, 'HEAD' or 'GET'. HEAD avoids downloading the
+                response body and falls back to GET if the server rejects it.
+            force_refresh (bool): Check the website even if a recent result is cached
             
         Returns:
             dict: Health check results
         """
-        result = {
-            'url': url,
-            'timestamp': datetime.now(timezone.utc).isoformat(),
-            'status_code': None,
-            'status_healthy': False,
-            'response_time': None,
-            'final_url': url,
-            'ssl_checked': False,
-            'ssl_valid': False,
-            'ssl_expiry': None,
-            'ssl_days_until_expiry': None,
-            'error': None
-        }
+        method = method.upper()
+        key = (url, timeout, follow_redirects, method)
+        if not force_refresh:
+            cached = self._result_cache.get(key)
+            if cached is not None and time.monotonic() - cached[1] < self.RESULT_CACHE_TTL:
+                result = dict(cached[0])
+                result['timestamp'] = time.time()
+                return result
+        
+        result = self._check_website_health(url, timeout, follow_redirects, method)
+        if result['error'] is not None:
+            # Report recovery as soon as it happens, not a stale failure
+            with self._result_cache_lock:
+                self._result_cache.pop(key, None)
+            return result
+        with self._result_cache_lock:
+            self._result_cache.pop(key, None)
+            if len(self._result_cache) >= self.RESULT_CACHE_MAXSIZE:
+                del self._result_cache[next(iter(self._result_cache))]
+            # Copied so callers can modify the returned result
+            self._result_cache[key] = (dict(result), time.monotonic())
+        return result
+    
+    def _check_website_health(self, url, timeout, follow_redirects, method):
+        """
+        Check a website without consulting the result cache
+        
+        Args:
+            url (str): Website URL to check
+            timeout (int): Request timeout in seconds
+            follow_redirects (bool): Whether to follow redirects
+            method (str): Upper-case HTTP method, 'HEAD' or 'GET'
+            
+        Returns:
+            dict: Health check results
+        """
+        result = self._new_result(url)
         
         try:
             # Start timing
             start_time = time.time()
             
             # Make HTTP request
-            response = self.session.get(
-                url,
-                timeout=timeout,
-                allow_redirects=follow_redirects,
-                verify=True  # Verify SSL certificates
-            )
-            
-            # Calculate response time
-            end_time = time.time()
-            result['response_time'] = end_time - start_time
-            
-            # Record status code and final URL
-            result['status_code'] = response.status_code
-            result['final_url'] = response.url
-            
-            # Check if status is healthy (2xx or 3xx)
-            result['status_healthy'] = 200 <= response.status_code < 400
+            response = self._send(method, url, timeout, follow_redirects)
+            try:
+                # Servers that don't support HEAD are re-checked with GET. Only the
+                # headers are read: the body is never downloaded, and the response
+                # time covers the header phase
+                if method == 'HEAD' and response.status_code in self.HEAD_FALLBACK_STATUS_CODES:
+                    self._release(response)
+                    start_time = time.time()
+                    response = self._send('GET', url, timeout, follow_redirects)
+                
+                # Calculate response time
+                end_time = time.time()
+                result['response_time'] = end_time - start_time
+                
+                # Record status code, and the final URL only if redirected
+                result['status_code'] = response.status_code
+                if response.history:
+                    result['redirected'] = True
+                    result['final_url'] = response.url
+                
+                # Check if status is healthy (2xx or 3xx)
+                result['status_healthy'] = 200 <= response.status_code < 400
+            finally:
+                self._release(response)
             
-            # Check SSL certificate if HTTPS
-            parsed_url = urlparse(result['final_url'])
+            # Check SSL certificate if HTTPS, going by the URL actually requested;
+            # final_url keeps the caller's spelling when there were no redirects
+            parsed_url = _parse_url(response.url)
             if parsed_url.scheme == 'https':
-                ssl_info = self._check_ssl_certificate(parsed_url.hostname, parsed_url.port or 443)
+                # Prefer the certificate from the request's own TLS connection
+                peer_cert = getattr(response, 'peer_cert', None)
+                if peer_cert:
+                    ssl_info = self._ssl_info_from_cert(peer_cert, getattr(response, 'peer_cert_der', None))
+                else:
+                    ssl_info = self._get_ssl_info(parsed_url.hostname, parsed_url.port or 443, timeout)
                 result.update(ssl_info)
             
         except requests.exceptions.SSLError as e:
@@ -92,17 +458,278 @@ class HealthChecker:
         
         return result
     
-    def _check_ssl_certificate(self, hostname, port=443):
+    def _send(self, method, url, timeout, follow_redirects):
         """
-        Check SSL certificate validity and expiration
+        Send a health check request without downloading the response body
+        
+        Args:
+            method (str): HTTP method
+            url (str): Website URL to request
+            timeout (int): Request timeout in seconds
+            follow_redirects (bool): Whether to follow redirects
+            
+        Returns:
+            requests.Response: Streamed response with only the headers read
+        """
+        return self.session.request(
+            method,
+            url,
+            timeout=timeout,
+            allow_redirects=follow_redirects,
+            verify=True,  # Verify SSL certificates
+            stream=True
+        )
+    
+    def _release(self, response):
+        """
+        Finish with a streamed response
+        
+        Empty and small bodies are drained so the keep-alive connection goes back
+        to the pool; anything larger closes the connection instead of being read.
+        
+        Args:
+            response (requests.Response): Response returned by _send
+        """
+        if response.request.method != 'HEAD':
+            length = response.headers.get('Content-Length', '')
+            if not length.isdigit() or int(length) > self.KEEPALIVE_DRAIN_LIMIT:
+                response.close()
+                return
+        try:
+            response.content
+        except requests.exceptions.RequestException:
+            pass
+        response.close()
+    
+    def _new_result(self, url):
+        """
+        Create a health check result for a URL with nothing checked yet
+        
+        Args:
+            url (str): Website URL being checked
+            
+        Returns:
+            dict: Health check result with default values
+        """
+        return {
+            'url': url,
+            'timestamp': time.time(),  # Unix time; formatted only for display
+            'status_code': None,
+            'status_healthy': False,
+            'response_time': None,
+            'final_url': url,
+            'redirected': False,
+            'ssl_checked': False,
+            'ssl_valid': False,
+            'ssl_expiry': None,
+            'ssl_days_until_expiry': None,
+            'error': None
+        }
+    
+    def _get_ssl_info(self, hostname, port=443, timeout=10):
+        """
+        Get SSL certificate information with a separate probe, reusing a recently
+        inspected certificate
+        
+        Used when the request's own connection did not expose its certificate (for
+        example with an injected session). The HTTPS request itself has already
+        verified the certificate chain, so a cached expiry date only needs its
+        time-dependent fields recomputed.
         
         Args:
             hostname (str): Hostname to check
             port (int): Port number (default 443)
+            timeout (int): Connection timeout in seconds (default 10)
             
         Returns:
             dict: SSL certificate information
         """
+        key = (hostname, port)
+        cached = self._ssl_cache.get(key)
+        if cached is not None:
+            expiry_date, cached_at = cached
+            if time.monotonic() - cached_at < CERT_CACHE_TTL and datetime.now(timezone.utc) < expiry_date:
+                return self._ssl_info_from_expiry(expiry_date)
+        
+        ssl_info, expiry_date = self._check_ssl_certificate(hostname, port, timeout)
+        if ssl_info['ssl_valid'] and expiry_date is not None:
+            self._ssl_cache[key] = (expiry_date, time.monotonic())
+        else:
+            self._ssl_cache.pop(key, None)
+        return ssl_info
+    
+    def _parse_cert_expiry(self, cert):
+        """
+        Parse the expiry date of a certificate
+        
+        Args:
+            cert (dict or callable): Certificate as returned by ssl.SSLSocket.getpeercert(),
+                or a callable returning it
+            
+        Returns:
+            datetime: Certificate expiry (timezone-aware, UTC), or None if the
+                certificate has no expiry date
+        """
+        if callable(cert):
+            cert = cert()
+        expiry_str = cert.get('notAfter') if cert else None
+        if not isinstance(expiry_str, str):
+            return None
+        
+        return _parse_cert_time(expiry_str)
+    
+    def _cert_expiry(self, cert, der=None):
+        """
+        Get the expiry date of a certificate, reusing the date parsed for the same
+        certificate within CERT_CACHE_TTL
+        
+        If cryptography is installed, the date is read from the DER form and cert
+        is only used for certificates cryptography can't parse.
+        
+        Args:
+            cert (dict or callable): Certificate as returned by ssl.SSLSocket.getpeercert(),
+                or a callable returning it, so it's only decoded when needed
+            der (bytes): The same certificate in DER form; if None, nothing is cached
+            
+        Returns:
+            datetime: Certificate expiry (timezone-aware, UTC), or None if the
+                certificate has no expiry date
+            
+        Raises:
+            ValueError: If the expiry date can't be parsed
+        """
+        if not der:
+            return self._parse_cert_expiry(cert)
+        
+        fingerprint = hashlib.sha256(der).digest()
+        now = time.monotonic()
+        with _cert_cache_lock:
+            entry = _cert_cache.get(fingerprint)
+        if entry is not None and now - entry[1] < CERT_CACHE_TTL:
+            return entry[0]
+        
+        if x509 is not None:
+            try:
+                expiry_date = _parse_der_expiry(der)
+            except ValueError:
+                # cryptography is stricter than OpenSSL, which already accepted
+                # this certificate during the handshake
+                expiry_date = self._parse_cert_expiry(cert)
+        else:
+            expiry_date = self._parse_cert_expiry(cert)
+        with _cert_cache_lock:
+            if fingerprint not in _cert_cache and len(_cert_cache) >= CERT_CACHE_MAXSIZE:
+                # Evict the oldest entry
+                del _cert_cache[next(iter(_cert_cache))]
+            _cert_cache[fingerprint] = (expiry_date, now)
+        return expiry_date
+    
+    def _ssl_info_from_cert(self, cert, der=None):
+        """
+        Build SSL certificate information from a certificate verified during the request
+        
+        Args:
+            cert (dict): Certificate as returned by ssl.SSLSocket.getpeercert()
+            der (bytes): The same certificate in DER form, used to cache the parsed expiry
+            
+        Returns:
+            dict: SSL certificate information
+        """
+        try:
+            expiry_date = self._cert_expiry(cert, der)
+        except ValueError:
+            return {
+                'ssl_checked': True,
+                'ssl_valid': False,
+                'ssl_expiry': None,
+                'ssl_days_until_expiry': None
+            }
+        
+        if expiry_date is None:
+            # Verified, but there is no expiry date to report
+            return {
+                'ssl_checked': True,
+                'ssl_valid': True,
+                'ssl_expiry': None,
+                'ssl_days_until_expiry': None
+            }
+        return self._ssl_info_from_expiry(expiry_date)
+    
+    def _ssl_info_from_expiry(self, expiry_date):
+        """
+        Build SSL certificate information from a certificate expiry date
+        
+        Args:
+            expiry_date (datetime): Certificate expiry (timezone-aware, UTC)
+            
+        Returns:
+            dict: SSL certificate information
+        """
+        # Calculate days until expiry
+        days_until_expiry = (expiry_date - datetime.now(timezone.utc)).days
+        return {
+            'ssl_checked': True,
+            # If certificate is expired, mark as invalid
+            'ssl_valid': days_until_expiry >= 0,
+            'ssl_expiry': expiry_date.strftime('%Y-%m-%d %H:%M:%S UTC'),
+            'ssl_days_until_expiry': days_until_expiry
+        }
+    
+    def _open_connection(self, hostname, port, timeout):
+        """
+        Open a TCP connection with a non-blocking connect bounded by a selector
+        
+        Args:
+            hostname (str): Hostname to connect to
+            port (int): Port number
+            timeout (int): Connection timeout in seconds, shared by all resolved addresses
+            
+        Returns:
+            socket.socket: Connected socket, in blocking mode with the remaining timeout
+        """
+        deadline = time.monotonic() + timeout
+        last_error = None
+        
+        for family, socktype, proto, _, address in _cached_getaddrinfo(hostname, port, type=socket.SOCK_STREAM):
+            sock = socket.socket(family, socktype, proto)
+            try:
+                sock.setblocking(False)
+                err = sock.connect_ex(address)
+                if err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    # Wait for the socket to become writable, i.e. the connect to finish
+                    with selectors.DefaultSelector() as selector:
+                        selector.register(sock, selectors.EVENT_WRITE)
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0 or not selector.select(remaining):
+                            raise socket.timeout(f"Connection to {hostname}:{port} timed out after {timeout} seconds")
+                    err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                if err:
+                    raise OSError(err, os.strerror(err))
+                
+                sock.settimeout(max(deadline - time.monotonic(), 0.001))
+                return sock
+            
+            except OSError as e:
+                sock.close()
+                last_error = e
+                if isinstance(e, socket.timeout):
+                    break
+        
+        raise last_error if last_error is not None else OSError(f"No addresses found for {hostname}")
+    
+    def _check_ssl_certificate(self, hostname, port=443, timeout=10):
+        """
+        Check SSL certificate validity and expiration
+        
+        Args:
+            hostname (str): Hostname to check
+            port (int): Port number (default 443)
+            timeout (int): Connection timeout in seconds (default 10)
+            
+        Returns:
+            tuple: (SSL certificate information dict, expiry datetime or None)
+        """
+        expiry_date = None
         ssl_result = {
             'ssl_checked': True,
             'ssl_valid': False,
@@ -111,36 +738,19 @@ class HealthChecker:
         }
         
         try:
-            # Create SSL context
-            context = ssl.create_default_context()
-            
             # Connect to the server
-            with socket.create_connection((hostname, port), timeout=10) as sock:
-                with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                    # Get certificate
-                    cert = ssock.getpeercert()
+            with self._open_connection(hostname, port, timeout) as sock:
+                with self._probe_ssl_context.wrap_socket(sock, server_hostname=hostname) as ssock:
+                    # Get certificate; the decoded form is only fetched if the DER form can't be used
+                    der = ssock.getpeercert(binary_form=True)
                     
                     # Certificate is valid if we got here without exception
                     ssl_result['ssl_valid'] = True
                     
                     # Parse expiry date
-                    if cert and 'notAfter' in cert:
-                        expiry_str = cert['notAfter']
-                        # Parse the date format: 'MMM DD HH:MM:SS YYYY GMT'
-                        if isinstance(expiry_str, str):
-                            expiry_date = datetime.strptime(expiry_str, '%b %d %H:%M:%S %Y %Z')
-                            expiry_date = expiry_date.replace(tzinfo=timezone.utc)
-                            
-                            ssl_result['ssl_expiry'] = expiry_date.strftime('%Y-%m-%d %H:%M:%S UTC')
-                            
-                            # Calculate days until expiry
-                            now = datetime.now(timezone.utc)
-                            days_until_expiry = (expiry_date - now).days
-                            ssl_result['ssl_days_until_expiry'] = days_until_expiry
-                            
-                            # If certificate is expired, mark as invalid
-                            if days_until_expiry < 0:
-                                ssl_result['ssl_valid'] = False
+                    expiry_date = self._cert_expiry(ssock.getpeercert, der)
+                    if expiry_date is not None:
+                        ssl_result = self._ssl_info_from_expiry(expiry_date)
                             
         except ssl.SSLError as e:
             ssl_result['ssl_valid'] = False
@@ -151,52 +761,251 @@ class HealthChecker:
         except Exception as e:
             ssl_result['ssl_valid'] = False
         
-        return ssl_result
+        return ssl_result, expiry_date
+    
+    def prefetch_dns(self, urls, exclude=()):
+        """
+        Resolve the hosts of URLs that are about to be checked, in the background
+        
+        Each distinct host not already in the DNS cache is looked up once, in
+        parallel, so checks that start later are likely to find it cached. Returns
+        immediately; a check that starts before its host is resolved looks it up
+        itself.
+        
+        Args:
+            urls (iterable): URLs whose hosts to resolve
+            exclude (iterable): URLs being checked right away; their hosts are
+                skipped, since those checks resolve them anyway
+        """
+        family = allowed_gai_family()
+        now = time.monotonic()
+        keys = self._url_hosts(urls) - self._url_hosts(exclude)
+        
+        # Same arguments urllib3 resolves with, so the cache entries are the ones it looks up
+        pending = []
+        with _dns_cache_lock:
+            for host, port in keys:
+                entry = _dns_cache.get((host, port, family, socket.SOCK_STREAM, 0, 0))
+                if entry is None or entry[0] <= now:
+                    pending.append((host, port))
+        if not pending:
+            return
+        
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(self.DNS_PREFETCH_WORKERS, len(pending)))
+        for host, port in pending:
+            executor.submit(_cached_getaddrinfo, host, port, family, socket.SOCK_STREAM)
+        executor.shutdown(wait=False)
+    
+    @staticmethod
+    def _url_hosts(urls):
+        """
+        Get the distinct (host, port) pairs of URLs, skipping ones without a host
+        
+        Args:
+            urls (iterable): URLs to read hosts from
+            
+        Returns:
+            set: (host, port) pairs
+        """
+        hosts = set()
+        for url in urls:
+            try:
+                parsed = _parse_url(url)
+                host = parsed.hostname
+                port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+            except (TypeError, ValueError):
+                continue
+            if host:
+                hosts.add((host, port))
+        return hosts
     
-    def check_multiple_websites(self, urls, timeout=10, follow_redirects=True):
+    def check_multiple_websites(self, urls, timeout=10, follow_redirects=True, method='HEAD', *,
+                                force_refresh=False, batch_timeout=None):
         """
-        Check multiple websites
+        Check multiple websites concurrently
         
         Args:
             urls (list): List of URLs to check
             timeout (int): Request timeout in seconds
             follow_redirects (bool): Whether to follow redirects
+            method (str): HTTP method, 'HEAD' or 'GET'
+            force_refresh (bool): Check every website even if a recent result is cached
+            batch_timeout (float): Seconds to wait for the whole batch. Checks still
+                running after this are reported with a batch timeout error. If None,
+                wait for every check.
             
         Returns:
-            list: List of health check results
+            list: List of health check results, in input order
         """
-        results = []
-        for url in urls:
-            result = self.check_website_health(url, timeout, follow_redirects)
-            results.append(result)
+        def check(_, url):
+            return self.check_website_health(url, timeout, follow_redirects, method, force_refresh=force_refresh)
+        
+        results = [None] * len(urls)
+        for i, result in self.run_checks(urls, check, batch_timeout=batch_timeout):
+            results[i] = result
         return results
     
+    def run_checks(self, urls, check, batch_timeout=None, on_timeout=None):
+        """
+        Run a check for each URL on a thread pool, yielding results as they finish
+        
+        At most MAX_WORKERS checks run at once. Checks that haven't started when the
+        caller stops iterating are cancelled.
+        
+        Args:
+            urls (list): URLs to check
+            check (callable): Called as check(index, url) on a worker thread and
+                returns that URL's result
+            batch_timeout (float): Seconds to wait for the whole batch. Checks still
+                running after this are reported with a batch timeout error. If None,
+                wait for every check.
+            on_timeout (callable): Called as on_timeout(index, result) with each
+                batch timeout result before it is yielded
+            
+        Yields:
+            tuple: (index of the URL in urls, result) in completion order
+        """
+        if not urls:
+            return
+        
+        workers = min(self.MAX_WORKERS, (os.cpu_count() or 1) * 5, len(urls))
+        # Warm the DNS cache for hosts that only later checks need
+        self.prefetch_dns(urls[workers:], exclude=urls[:workers])
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        futures = {executor.submit(check, i, url): i for i, url in enumerate(urls)}
+        pending = set(futures)
+        
+        try:
+            try:
+                for future in concurrent.futures.as_completed(futures, timeout=batch_timeout):
+                    pending.discard(future)
+                    yield futures[future], future.result()
+            
+            except concurrent.futures.TimeoutError:
+                # Report stragglers instead of letting one stuck host stall the batch
+                for future in sorted(pending, key=futures.get):
+                    i = futures[future]
+                    if future.done() and not future.cancelled():
+                        # Finished between the deadline and now
+                        yield i, future.result()
+                        continue
+                    
+                    future.cancel()
+                    result = self._new_result(urls[i])
+                    result['error'] = f"Batch Timeout: Check did not finish within {batch_timeout} seconds"
+                    if on_timeout is not None:
+                        on_timeout(i, result)
+                    yield i, result
+        
+        finally:
+            # Don't start checks nobody will consume, and don't wait for stragglers;
+            # they finish in the background within their own timeout
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+    
+    async def check_multiple_websites_async(self, urls, timeout=10, follow_redirects=True, method='HEAD', *,
+                                            force_refresh=False, max_concurrency=100):
+        """
+        Check multiple websites from an asyncio event loop
+        
+        Args:
+            urls (list): List of URLs to check
+            timeout (int): Request timeout in seconds
+            follow_redirects (bool): Whether to follow redirects
+            method (str): HTTP method, 'HEAD' or 'GET'
+            force_refresh (bool): Check every website even if a recent result is cached
+            max_concurrency (int): Maximum number of checks in flight (default 100,
+                the default session's POOL_MAXSIZE)
+            
+        Returns:
+            list: List of health check results, in input order
+        """
+        def check(_, url):
+            return self.check_website_health(url, timeout, follow_redirects, method, force_refresh=force_refresh)
+        
+        return await self.run_checks_async(urls, check, max_concurrency=max_concurrency)
+    
+    async def run_checks_async(self, urls, check, max_concurrency=100):
+        """
+        Run a check for each URL on a thread pool, awaiting the results
+        
+        The event loop is never blocked on network I/O. If the coroutine is
+        cancelled, queued checks are dropped and running ones finish in the
+        background instead of being waited for.
+        
+        Args:
+            urls (list): URLs to check
+            check (callable): Called as check(index, url) on a worker thread and
+                returns that URL's result
+            max_concurrency (int): Maximum number of checks in flight
+            
+        Returns:
+            list: Check results, in input order
+        """
+        if not urls:
+            return []
+        
+        workers = min(max_concurrency, len(urls))
+        self.prefetch_dns(urls[workers:], exclude=urls[:workers])
+        loop = asyncio.get_running_loop()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        try:
+            results = await asyncio.gather(*[
+                loop.run_in_executor(executor, check, i, url) for i, url in enumerate(urls)
+            ])
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return list(results)
+    
     def get_health_summary(self, results):
         """
         Generate summary statistics from health check results
         
         Args:
-            results (list): List of health check results
+            results (iterable): Health check results; any iterable, including a
+                generator, is consumed in a single pass without being stored
             
         Returns:
-            dict: Summary statistics
+            dict: Summary statistics (empty if there were no results)
         """
-        if not results:
-            return {}
+        total_sites = 0
+        healthy_sites = 0
+        ssl_checked = 0
+        ssl_valid = 0
+        error_count = 0
         
-        total_sites = len(results)
-        healthy_sites = sum(1 for r in results if r['status_healthy'])
+        # Response time statistics are over successful requests only
+        response_time_count = 0
+        response_time_total = 0
+        fastest_response_time = None
+        slowest_response_time = None
         
-        # Calculate average response time for successful requests
-        response_times = [r['response_time'] for r in results if r['response_time'] is not None]
-        avg_response_time = sum(response_times) / len(response_times) if response_times else 0
+        # Accumulate every statistic in a single pass over the results
+        for r in results:
+            total_sites += 1
+            if r['status_healthy']:
+                healthy_sites += 1
+            if r['ssl_checked']:
+                ssl_checked += 1
+            if r['ssl_valid']:
+                ssl_valid += 1
+            if r['error'] is not None:
+                error_count += 1
+            
+            response_time = r['response_time']
+            if response_time is not None:
+                response_time_count += 1
+                response_time_total += response_time
+                if fastest_response_time is None or response_time < fastest_response_time:
+                    fastest_response_time = response_time
+                if slowest_response_time is None or response_time > slowest_response_time:
+                    slowest_response_time = response_time
         
-        # SSL statistics
-        ssl_checked = sum(1 for r in results if r['ssl_checked'])
-        ssl_valid = sum(1 for r in results if r['ssl_valid'])
+        if not total_sites:
+            return {}
         
-        # Sites with errors
-        error_count = sum(1 for r in results if r['error'] is not None)
+        avg_response_time = response_time_total / response_time_count if response_time_count else 0
         
         return {
             'total_sites': total_sites,
@@ -208,6 +1017,6 @@ class HealthChecker:
             'ssl_valid_sites': ssl_valid,
             'ssl_invalid_sites': ssl_checked - ssl_valid,
             'sites_with_errors': error_count,
-            'fastest_response_time': min(response_times) if response_times else None,
-            'slowest_response_time': max(response_times) if response_times else None
+            'fastest_response_time': fastest_response_time,
+            'slowest_response_time': slowest_response_time
         }
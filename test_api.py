@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+
+from api import HealthCheckerAPI, _is_valid_url
+
+
+class ValidateUrlTest(unittest.TestCase):
+
+    def test_accepts_http_and_https_urls(self):
+        for url in ('http://example.com', 'HTTPS://example.com/path?q=1', 'https://[::1]:8443/',
+                    ' https://example.com'):
+            with self.subTest(url=url):
+                self.assertTrue(_is_valid_url(url))
+
+    def test_rejects_urls_without_a_host(self):
+        for url in ('http://', 'http:///path', 'http://?x', 'http://#f', 'http:// example.com'):
+            with self.subTest(url=url):
+                self.assertFalse(_is_valid_url(url))
+
+    def test_rejects_other_schemes(self):
+        for url in ('ftp://example.com', 'example.com', 'mailto:someone@example.com'):
+            with self.subTest(url=url):
+                self.assertFalse(_is_valid_url(url))
+
+
+class LoggingTest(unittest.TestCase):
+
+    def test_instances_sharing_the_logger_write_in_order(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log_file = os.path.join(directory, 'health.log')
+            apis = []
+            for name in ('first', 'second', 'third'):
+                api = HealthCheckerAPI(log_file=log_file, enable_console_logging=False)
+                api.logger.info('marker %s', name)
+                apis.append(api)
+            # Replaced instances have already flushed and released their log file
+            self.assertIsNone(apis[0]._file_handler.stream)
+            # Closed last-in-first-out, as atexit does
+            for api in reversed(apis):
+                api.close()
+
+            with open(log_file, encoding='utf-8') as f:
+                markers = [line.rsplit(' ', 1)[-1] for line in f.read().splitlines() if 'marker' in line]
+            self.assertEqual(markers, ['first', 'second', 'third'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,240 @@
+import concurrent.futures
+import hashlib
+import http.server
+import io
+import os
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+import requests
+import urllib3
+
+import health_checker
+from health_checker import HealthChecker
+
+
+class FakeAdapter(requests.adapters.BaseAdapter):
+    """Adapter that answers every request without touching the network"""
+
+    def __init__(self, status_code=200, error=None, delays=None):
+        super().__init__()
+        self.status_code = status_code
+        self.error = error
+        self.delays = delays or {}
+        self.calls = []
+
+    def send(self, request, **kwargs):
+        self.calls.append((request.method, request.url, kwargs.get('timeout')))
+        time.sleep(self.delays.get(request.url, 0))
+        if self.error is not None:
+            raise self.error
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.url = request.url
+        response.request = request
+        response.headers['Content-Length'] = '0'
+        response.raw = io.BytesIO(b'')
+        return response
+
+    def close(self):
+        pass
+
+
+def make_checker(adapter):
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return HealthChecker(session=session)
+
+
+class ResultCacheTest(unittest.TestCase):
+    URL = 'http://example.test/'
+
+    def test_recent_result_is_reused(self):
+        adapter = FakeAdapter()
+        checker = make_checker(adapter)
+        first = checker.check_website_health(self.URL)
+        second = checker.check_website_health(self.URL)
+        self.assertEqual(len(adapter.calls), 1)
+        self.assertEqual(second['status_code'], 200)
+        self.assertGreaterEqual(second['timestamp'], first['timestamp'])
+
+    def test_returned_result_can_be_modified(self):
+        checker = make_checker(FakeAdapter())
+        checker.check_website_health(self.URL)['status_code'] = 500
+        self.assertEqual(checker.check_website_health(self.URL)['status_code'], 200)
+
+    def test_force_refresh_checks_again(self):
+        adapter = FakeAdapter()
+        checker = make_checker(adapter)
+        checker.check_website_health(self.URL)
+        checker.check_website_health(self.URL, force_refresh=True)
+        self.assertEqual(len(adapter.calls), 2)
+
+    def test_timeout_is_part_of_the_key(self):
+        adapter = FakeAdapter()
+        checker = make_checker(adapter)
+        checker.check_website_health(self.URL, timeout=1)
+        checker.check_website_health(self.URL, timeout=10)
+        self.assertEqual([call[2] for call in adapter.calls], [1, 10])
+
+    def test_failures_are_not_cached(self):
+        adapter = FakeAdapter(error=requests.exceptions.Timeout())
+        checker = make_checker(adapter)
+        failed = checker.check_website_health(self.URL, timeout=1)
+        self.assertIn('Timeout', failed['error'])
+
+        adapter.error = None
+        recovered = checker.check_website_health(self.URL, timeout=1)
+        self.assertEqual(len(adapter.calls), 2)
+        self.assertIsNone(recovered['error'])
+        self.assertEqual(recovered['status_code'], 200)
+
+
+class BatchTimeoutTest(unittest.TestCase):
+    FAST = 'http://fast.test/'
+    SLOW = 'http://slow.test/'
+
+    def test_stragglers_are_reported_as_batch_timeouts(self):
+        checker = make_checker(FakeAdapter(delays={self.SLOW: 1}))
+        start = time.monotonic()
+        fast, slow = checker.check_multiple_websites([self.FAST, self.SLOW], batch_timeout=0.2)
+        self.assertLess(time.monotonic() - start, 0.9)
+        self.assertEqual(fast['status_code'], 200)
+        self.assertIsNone(slow['status_code'])
+        self.assertTrue(slow['error'].startswith('Batch Timeout'))
+        self.assertEqual(slow['url'], self.SLOW)
+
+    def test_checks_finished_after_the_deadline_keep_their_result(self):
+        def deadline_hit_late(futures, timeout=None):
+            # Every check completes before the deadline is noticed
+            concurrent.futures.wait(futures)
+            raise concurrent.futures.TimeoutError
+            yield
+
+        checker = make_checker(FakeAdapter())
+        with mock.patch('concurrent.futures.as_completed', deadline_hit_late):
+            results = checker.check_multiple_websites([self.FAST, self.SLOW], batch_timeout=1)
+        self.assertEqual([result['status_code'] for result in results], [200, 200])
+        self.assertEqual([result['error'] for result in results], [None, None])
+
+    def test_on_timeout_sees_each_straggler(self):
+        checker = make_checker(FakeAdapter(delays={self.SLOW: 1}))
+        timed_out = []
+        list(checker.run_checks(
+            [self.FAST, self.SLOW],
+            lambda _, url: checker.check_website_health(url),
+            batch_timeout=0.2,
+            on_timeout=lambda i, result: timed_out.append(i)
+        ))
+        self.assertEqual(timed_out, [1])
+
+
+class CertExpiryTest(unittest.TestCase):
+    DER = b'not really DER'
+
+    def tearDown(self):
+        health_checker._cert_cache.pop(hashlib.sha256(self.DER).digest(), None)
+
+    def test_unparseable_der_falls_back_to_the_decoded_certificate(self):
+        get_cert = mock.Mock(return_value={'notAfter': 'Jan  1 00:00:00 2030 GMT'})
+        with mock.patch.object(health_checker, 'x509', mock.Mock()), \
+                mock.patch.object(health_checker, '_parse_der_expiry', side_effect=ValueError):
+            expiry = HealthChecker()._cert_expiry(get_cert, self.DER)
+        self.assertEqual(expiry, datetime(2030, 1, 1, tzinfo=timezone.utc))
+        get_cert.assert_called_once_with()
+
+    def test_decoded_certificate_is_not_fetched_when_der_parses(self):
+        get_cert = mock.Mock()
+        expiry = datetime(2030, 1, 1, tzinfo=timezone.utc)
+        with mock.patch.object(health_checker, 'x509', mock.Mock()), \
+                mock.patch.object(health_checker, '_parse_der_expiry', return_value=expiry):
+            self.assertEqual(HealthChecker()._cert_expiry(get_cert, self.DER), expiry)
+        get_cert.assert_not_called()
+
+
+class QuietHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@unittest.skipIf(shutil.which('openssl') is None, 'openssl is needed to create a test certificate')
+class PeerCertTest(unittest.TestCase):
+    """Checks against a local HTTPS server with a self-signed certificate"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.cert_file = os.path.join(cls.directory.name, 'cert.pem')
+        key_file = os.path.join(cls.directory.name, 'key.pem')
+        subprocess.run(
+            ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '2',
+             '-keyout', key_file, '-out', cls.cert_file, '-subj', '/CN=localhost',
+             '-addext', 'subjectAltName=DNS:localhost,IP:127.0.0.1'],
+            check=True, capture_output=True
+        )
+
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cls.cert_file, key_file)
+        cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), QuietHandler)
+        cls.server.socket = context.wrap_socket(cls.server.socket, server_side=True)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f'https://127.0.0.1:{cls.server.server_address[1]}/'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.directory.cleanup()
+
+    def setUp(self):
+        environ = mock.patch.dict(os.environ, {'REQUESTS_CA_BUNDLE': self.cert_file})
+        environ.start()
+        self.addCleanup(environ.stop)
+        self.checker = HealthChecker()
+        self.addCleanup(self.checker.session.close)
+
+    def test_peer_certificate_is_captured(self):
+        response = self.checker.session.head(self.url, timeout=5)
+        response.close()
+        with open(self.cert_file) as f:
+            der = ssl.PEM_cert_to_DER_cert(f.read())
+        self.assertEqual(response.peer_cert['subject'], ((('commonName', 'localhost'),),))
+        self.assertEqual(response.peer_cert_der, der)
+
+    def test_no_separate_certificate_probe(self):
+        with mock.patch.object(self.checker, '_check_ssl_certificate') as probe:
+            result = self.checker.check_website_health(self.url, timeout=5)
+        probe.assert_not_called()
+        self.assertIsNone(result['error'])
+        self.assertTrue(result['ssl_valid'])
+        self.assertEqual(result['ssl_days_until_expiry'], 1)
+
+    def test_ca_certs_cleared_only_for_pools_using_the_shared_context(self):
+        self.checker.check_website_health(self.url, timeout=5)
+        adapter = self.checker.session.get_adapter(self.url)
+        shared_pool = adapter.poolmanager.connection_from_url(self.url)
+        self.assertIsNone(shared_pool.ca_certs)
+
+        own_context_pool = urllib3.HTTPSConnectionPool('127.0.0.1', self.server.server_address[1])
+        self.addCleanup(own_context_pool.close)
+        adapter.cert_verify(own_context_pool, self.url, self.cert_file, None)
+        self.assertEqual(own_context_pool.ca_certs, self.cert_file)
+
+
+if __name__ == '__main__':
+    unittest.main()